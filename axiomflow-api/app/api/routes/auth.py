@@ -1,22 +1,22 @@
 from __future__ import annotations
 
 import base64
-import io
-import json
 import logging
 import mimetypes
+import os
 import re
+import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote, urlencode
-from urllib.request import Request as UrlRequest
-from urllib.request import urlopen
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
 from fastapi.responses import FileResponse, RedirectResponse
-from sqlalchemy import delete, func, select, update
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_current_user
 from app.core.config import get_settings
@@ -66,6 +66,7 @@ from app.schemas.auth import (
     UpdateAvatarRequest,
     VerifyEmailRequest,
 )
+from app.services.http_client import get_http_client
 from app.services.mailer import send_password_reset_email, send_verification_email
 from app.services.mailer import send_security_alert_email, send_translation_completed_email
 from app.services.math_captcha import issue_math_challenge, validate_and_consume_math
@@ -79,7 +80,10 @@ logger = logging.getLogger("axiomflow.oauth")
 MAX_AVATAR_URL_LEN = 2_000_000
 
 _UNAME_CLEAN_RE = re.compile(r"[^a-zA-Z0-9_]+")
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\-.()\[\] ]+")
 _DOC_STORAGE_ROOT = Path(__file__).resolve().parents[3] / "storage" / "documents"
+# Resolved once: the containment checks below otherwise re-walk the root on every call.
+_DOC_STORAGE_ROOT_ABS = _DOC_STORAGE_ROOT.resolve()
 
 
 def _require_slide(*, captcha_id: str, piece_final_x: int) -> None:
@@ -94,7 +98,7 @@ def _require_math(*, captcha_id: str, answer: int) -> None:
 
 def _safe_filename(name: str) -> str:
     base = Path(name or "").name.strip() or "uploaded-file.pdf"
-    base = re.sub(r"[^\w\-.()\[\] ]+", "_", base)
+    base = _FILENAME_UNSAFE_RE.sub("_", base)
     return base[:255]
 
 
@@ -102,11 +106,10 @@ def _document_abs_path_or_404(*, rel_path: str) -> Path:
     rel = (rel_path or "").strip()
     if not rel:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="document_file_not_found")
-    abs_path = (_DOC_STORAGE_ROOT / rel).resolve()
-    root_abs = _DOC_STORAGE_ROOT.resolve()
-    if root_abs not in abs_path.parents and abs_path != root_abs:
+    abs_path = (_DOC_STORAGE_ROOT_ABS / rel).resolve()
+    if _DOC_STORAGE_ROOT_ABS not in abs_path.parents and abs_path != _DOC_STORAGE_ROOT_ABS:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_document_path")
-    if not abs_path.exists() or not abs_path.is_file():
+    if not abs_path.is_file():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="document_file_not_found")
     return abs_path
 
@@ -115,16 +118,57 @@ def _document_abs_path_or_none(*, rel_path: str) -> Path | None:
     rel = (rel_path or "").strip()
     if not rel:
         return None
-    abs_path = (_DOC_STORAGE_ROOT / rel).resolve()
-    root_abs = _DOC_STORAGE_ROOT.resolve()
-    if root_abs not in abs_path.parents and abs_path != root_abs:
-        return None
-    if not abs_path.exists() or not abs_path.is_file():
+    abs_path = (_DOC_STORAGE_ROOT_ABS / rel).resolve()
+    if _DOC_STORAGE_ROOT_ABS not in abs_path.parents or not abs_path.is_file():
         return None
     return abs_path
 
 
+def _user_stored_files(user_id: str) -> set[str]:
+    """
+    Relative paths of the files under the user's storage directory, read with a
+    single scandir so listings don't resolve and stat every row separately.
+    """
+    try:
+        with os.scandir(_DOC_STORAGE_ROOT_ABS / user_id) as it:
+            return {f"{user_id}/{e.name}" for e in it if e.is_file(follow_symlinks=False)}
+    except OSError:
+        return set()
+
+
+def _remove_stored_file(rel_path: str) -> None:
+    rel = (rel_path or "").strip()
+    if not rel:
+        return
+    p = (_DOC_STORAGE_ROOT_ABS / rel).resolve()
+    if _DOC_STORAGE_ROOT_ABS in p.parents and p.is_file():
+        try:
+            p.unlink()
+        except Exception:
+            logger.warning("document_file_delete_failed path=%s", p, exc_info=True)
+
+
+def _has_stored_file(*, rel_path: str, user_id: str, stored: set[str]) -> bool:
+    rel = rel_path.strip()
+    if rel.rpartition("/")[0] == user_id:
+        return rel in stored
+    # Rows written outside the <user_id>/<file> layout take the per-path check.
+    return _document_abs_path_or_none(rel_path=rel) is not None
+
+
+@lru_cache(maxsize=1)
+def _oauth_placeholder_password_hash() -> str:
+    """
+    Password hash for accounts created through OAuth. The secret behind it is random
+    and discarded, so no password verifies against it; hashing it once per process
+    keeps argon2 off every first-time OAuth sign-up.
+    """
+    return hash_password(new_token_raw(24))
+
+
+@lru_cache(maxsize=None)
 def _oauth_callback_url(provider: str) -> str:
+    # Settings are loaded once per process, so the URL per provider never changes.
     s = get_settings()
     return f"{s.PUBLIC_API_URL.rstrip('/')}/auth/oauth/{provider}/callback"
 
@@ -145,25 +189,15 @@ def _frontend_oauth_result_redirect(
 
 
 def _http_post_form_json(url: str, form_data: dict[str, str], headers: dict[str, str] | None = None) -> dict:
-    payload = urlencode(form_data).encode("utf-8")
-    req = UrlRequest(url, data=payload, method="POST")
-    req.add_header("Content-Type", "application/x-www-form-urlencoded")
-    req.add_header("Accept", "application/json")
-    if headers:
-        for k, v in headers.items():
-            req.add_header(k, v)
-    with urlopen(req, timeout=12) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    resp = get_http_client().post(url, data=form_data, headers={"Accept": "application/json", **(headers or {})})
+    resp.raise_for_status()
+    return resp.json()
 
 
 def _http_get_json(url: str, headers: dict[str, str] | None = None):
-    req = UrlRequest(url, method="GET")
-    req.add_header("Accept", "application/json")
-    if headers:
-        for k, v in headers.items():
-            req.add_header(k, v)
-    with urlopen(req, timeout=12) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    resp = get_http_client().get(url, headers={"Accept": "application/json", **(headers or {})})
+    resp.raise_for_status()
+    return resp.json()
 
 
 def _fetch_avatar_data_uri(url: str | None) -> str:
@@ -175,17 +209,15 @@ def _fetch_avatar_data_uri(url: str | None) -> str:
     if not u.startswith("http"):
         return ""
     try:
-        req = UrlRequest(
-            u,
-            headers={
-                "User-Agent": "AxiomFlow-OAuth/1.0",
-                "Accept": "image/*,*/*;q=0.8",
-            },
-            method="GET",
-        )
-        with urlopen(req, timeout=10) as resp:
+        with get_http_client().stream("GET", u, headers={"Accept": "image/*,*/*;q=0.8"}, timeout=10) as resp:
+            resp.raise_for_status()
             ctype = str(resp.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
-            raw = resp.read(1024 * 1024)  # cap to 1MB for avatar
+            buf = bytearray()
+            for chunk in resp.iter_bytes():
+                buf += chunk
+                if len(buf) >= 1024 * 1024:  # cap to 1MB for avatar
+                    break
+            raw = bytes(buf[: 1024 * 1024])
         if not ctype.startswith("image/") or not raw:
             return ""
         b64 = base64.b64encode(raw).decode("ascii")
@@ -209,12 +241,12 @@ def _choose_avatar_for_storage(*, avatar_data_uri: str, avatar_hint: str) -> str
 
 
 def _derive_unique_username(db: Session, email: str) -> str:
-    local = (email.split("@", 1)[0] if "@" in email else email).strip().lower()
+    local = email.partition("@")[0].strip().lower()
     base = _UNAME_CLEAN_RE.sub("_", local).strip("_") or "user"
     base = base[:50]
     candidate = base
     i = 0
-    while db.scalar(select(User).where(User.username == candidate)):
+    while db.scalar(select(exists().where(User.username == candidate))):
         i += 1
         candidate = f"{base}_{i}"
         if len(candidate) > 64:
@@ -254,21 +286,44 @@ def _mask_api_key(*, key_prefix: str, key_last4: str) -> str:
     return f"{key_prefix}{'*' * 20}{key_last4}"
 
 
+def _send_security_alert_quietly(*, user_id: str, to_email: str, event: str, tag: str) -> None:
+    # Runs as a BackgroundTask after the response is sent; failures are only logged.
+    try:
+        send_security_alert_email(to_email=to_email, event=event)
+    except Exception:
+        logger.warning("send_security_alert_email_failed user=%s event=%s", user_id, tag, exc_info=True)
+
+
+def _send_translation_completed_quietly(
+    *, user_id: str, to_email: str, title: str, document_count: int, word_count: int
+) -> None:
+    try:
+        send_translation_completed_email(
+            to_email=to_email,
+            title=title,
+            document_count=document_count,
+            word_count=word_count,
+        )
+    except Exception:
+        logger.warning("send_translation_completed_email_failed user=%s", user_id, exc_info=True)
+
+
 def _issue_login_response_for_user(*, request: Request, db: Session, user: User) -> tuple[TokenResponse, str]:
     pair = create_access_token(subject=user.id, extra={"email": user.email})
 
     settings = get_settings()
+    now = now_utc()
     refresh_raw = new_token_raw()
     refresh_hash = token_sha256(refresh_raw)
     refresh = RefreshToken(
         user_id=user.id,
         token_hash=refresh_hash,
-        expires_at=now_utc() + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
+        expires_at=now + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
         user_agent=request.headers.get("user-agent"),
         ip=request.client.host if request.client else None,
     )
     db.add(refresh)
-    user.last_login_at = now_utc()
+    user.last_login_at = now
     db.commit()
 
     return TokenResponse(access_token=pair.access_token, access_expires_at=pair.access_expires_at), refresh_raw
@@ -367,8 +422,13 @@ def oauth_callback(provider: str, request: Request, code: str = "", state: str =
             access = token_json.get("access_token")
             if not access:
                 raise ValueError("missing_access_token")
-            profile = _http_get_json("https://api.github.com/user", {"Authorization": f"Bearer {access}"})
-            emails = _http_get_json("https://api.github.com/user/emails", {"Authorization": f"Bearer {access}"})
+            gh_headers = {"Authorization": f"Bearer {access}"}
+            # Both lookups only need the token: fetch emails on a helper thread while
+            # this one fetches the profile, so the callback waits for one round trip.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                emails_future = pool.submit(_http_get_json, "https://api.github.com/user/emails", gh_headers)
+                profile = _http_get_json("https://api.github.com/user", gh_headers)
+                emails = emails_future.result()
             email = ""
             github_email_verified = False
             profile_email = str(profile.get("email") or "").strip().lower()
@@ -410,34 +470,30 @@ def oauth_callback(provider: str, request: Request, code: str = "", state: str =
             uname = _UNAME_CLEAN_RE.sub("_", username_hint).strip("_")[:64] if username_hint else ""
             if not uname or len(uname) < 2:
                 uname = _derive_unique_username(db, email)
-            if db.scalar(select(User).where(User.username == uname)):
+            if db.scalar(select(exists().where(User.username == uname))):
                 uname = _derive_unique_username(db, email)
             user = User(
                 email=email,
                 username=uname,
                 avatar_url=_choose_avatar_for_storage(avatar_data_uri=avatar_data_uri, avatar_hint=avatar_hint),
-                password_hash=hash_password(new_token_raw(24)),
+                password_hash=_oauth_placeholder_password_hash(),
                 is_email_verified=email_verified_from_provider,
                 is_oauth_verified=oauth_verified,
             )
             db.add(user)
-            db.commit()
-            db.refresh(user)
+            # Flush for the primary key (and any unique-username clash); the refresh
+            # token below commits the new account in the same transaction.
+            db.flush()
         else:
-            changed = False
             if oauth_verified and not user.is_oauth_verified:
                 user.is_oauth_verified = True
-                changed = True
             if email_verified_from_provider and not user.is_email_verified:
                 user.is_email_verified = True
-                changed = True
             merged_avatar = _choose_avatar_for_storage(avatar_data_uri=avatar_data_uri, avatar_hint=avatar_hint)
             if merged_avatar and user.avatar_url != merged_avatar:
                 user.avatar_url = merged_avatar
-                changed = True
-            if changed:
-                db.commit()
 
+        # Commits any user changes above together with the new refresh token.
         _, refresh_raw = _issue_login_response_for_user(request=request, db=db, user=user)
         rr = RedirectResponse(
             _frontend_oauth_result_redirect(oauth_done=True),
@@ -497,7 +553,6 @@ def update_notification_preferences(
     user.notify_browser = bool(payload.notify_browser)
     user.notify_marketing = bool(payload.notify_marketing)
     db.commit()
-    db.refresh(user)
     return NotificationPreferencesResponse(
         notify_email=bool(user.notify_email),
         notify_browser=bool(user.notify_browser),
@@ -536,7 +591,6 @@ def update_user_preferences(
     user.auto_save_history = bool(payload.auto_save_history)
     user.enable_shortcuts = bool(payload.enable_shortcuts)
     db.commit()
-    db.refresh(user)
     return UserPreferencesResponse(
         preferred_target_language=(user.preferred_target_language or "zh-CN"),
         ui_language=(user.ui_language or "zh-CN"),
@@ -579,7 +633,6 @@ def update_upload_output_preferences(
     user.auto_import_provider = payload.auto_import_provider
     user.default_output_format = payload.default_output_format
     db.commit()
-    db.refresh(user)
     return UploadOutputPreferencesResponse(
         upload_size_limit_mb=int(user.upload_size_limit_mb or 20),
         auto_import_provider=(user.auto_import_provider or "none"),
@@ -610,7 +663,6 @@ def update_privacy_settings(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_data_retention_days")
     user.data_retention_days = int(payload.data_retention_days)
     db.commit()
-    db.refresh(user)
     return PrivacySettingsResponse(
         data_retention_days=int(user.data_retention_days if user.data_retention_days is not None else 7),
         updated_at=user.updated_at,
@@ -625,20 +677,27 @@ def list_api_keys(
     db: Session = Depends(get_db),
 ) -> list[ApiKeyItemResponse]:
     rows = db.execute(
-        select(ApiKey)
+        select(
+            ApiKey.id,
+            ApiKey.key_prefix,
+            ApiKey.key_last4,
+            ApiKey.created_at,
+            ApiKey.last_used_at,
+            ApiKey.revoked_at,
+        )
         .where(ApiKey.user_id == user.id)
         .order_by(ApiKey.created_at.desc())
         .limit(100)
-    ).scalars().all()
+    ).all()
     return [
         ApiKeyItemResponse(
-            id=row.id,
-            masked_key=_mask_api_key(key_prefix=row.key_prefix, key_last4=row.key_last4),
-            created_at=row.created_at,
-            last_used_at=row.last_used_at,
-            revoked_at=row.revoked_at,
+            id=key_id,
+            masked_key=_mask_api_key(key_prefix=key_prefix, key_last4=key_last4),
+            created_at=created_at,
+            last_used_at=last_used_at,
+            revoked_at=revoked_at,
         )
-        for row in rows
+        for key_id, key_prefix, key_last4, created_at, last_used_at, revoked_at in rows
     ]
 
 
@@ -689,6 +748,7 @@ def revoke_api_key(
 def notify_translation_completed(
     request: Request,
     payload: TranslationCompletedNotifyRequest,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> OkResponse:
@@ -718,15 +778,14 @@ def notify_translation_completed(
     db.commit()
 
     if user.notify_email:
-        try:
-            send_translation_completed_email(
-                to_email=user.email,
-                title=title,
-                document_count=doc_count,
-                word_count=word_count,
-            )
-        except Exception:
-            logger.warning("send_translation_completed_email_failed user=%s", user.id, exc_info=True)
+        background_tasks.add_task(
+            _send_translation_completed_quietly,
+            user_id=user.id,
+            to_email=user.email,
+            title=title,
+            document_count=doc_count,
+            word_count=word_count,
+        )
     return OkResponse(ok=True)
 
 
@@ -913,6 +972,7 @@ def list_documents(request: Request, user: User = Depends(get_current_user), db:
         .order_by(UserDocument.created_at.desc())
         .limit(200)
     ).all()
+    stored = _user_stored_files(user.id)
 
     return [
         DocumentItemResponse(
@@ -924,7 +984,7 @@ def list_documents(request: Request, user: User = Depends(get_current_user), db:
             document_count=1,
             word_count=int(word_count or 0),
             status=(status_text or "completed"),
-            has_original_file=bool(_document_abs_path_or_none(rel_path=original_storage_path or "")),
+            has_original_file=_has_stored_file(rel_path=original_storage_path or "", user_id=user.id, stored=stored),
             has_translated_file=bool(translated_storage_path),
         )
         for row_id, file_name, created_at, mime_type, original_storage_path, file_size_bytes, word_count, status_text, translated_storage_path in rows
@@ -948,7 +1008,7 @@ async def upload_document(
     safe_name = _safe_filename(file.filename or "uploaded-file.pdf")
     ext = Path(safe_name).suffix or ".bin"
     rel_path = Path(user.id) / f"{uuid.uuid4().hex}{ext}"
-    abs_path = (_DOC_STORAGE_ROOT / rel_path).resolve()
+    abs_path = _DOC_STORAGE_ROOT_ABS / rel_path
     abs_path.parent.mkdir(parents=True, exist_ok=True)
     abs_path.write_bytes(raw)
 
@@ -1007,8 +1067,10 @@ def document_meta(
     if name.endswith(".pdf") or "pdf" in mime:
         try:
             abs_path = _document_abs_path_or_404(rel_path=row.original_storage_path or "")
-            reader = PdfReader(io.BytesIO(abs_path.read_bytes()))
-            page_count = max(1, len(reader.pages))
+            # Hand pypdf the open file: it seeks to the xref and page tree instead of
+            # copying the whole upload into memory (a path argument would be buffered too).
+            with abs_path.open("rb") as fh:
+                page_count = max(1, len(PdfReader(fh).pages))
         except HTTPException:
             raise
         except Exception:
@@ -1047,6 +1109,21 @@ def download_document(
         suffix = Path(out_name).suffix or ".pdf"
         out_name = f"{stem}.translated{suffix}"
 
+    accel_prefix = get_settings().DOC_ACCEL_REDIRECT_PREFIX.strip().rstrip("/")
+    if accel_prefix:
+        # nginx serves the file itself (sendfile) from its internal location; the worker
+        # only returns headers. Content-Disposition mirrors FileResponse.
+        rel_posix = abs_path.relative_to(_DOC_STORAGE_ROOT_ABS).as_posix()
+        quoted_name = quote(out_name)
+        if quoted_name != out_name:
+            disposition = f"attachment; filename*=utf-8''{quoted_name}"
+        else:
+            disposition = f'attachment; filename="{out_name}"'
+        return Response(
+            media_type=row.mime_type or "application/octet-stream",
+            headers={"X-Accel-Redirect": f"{accel_prefix}/{quote(rel_posix)}", "Content-Disposition": disposition},
+        )
+
     return FileResponse(
         path=str(abs_path),
         media_type=row.mime_type or "application/octet-stream",
@@ -1065,16 +1142,8 @@ def delete_document(
     row = db.scalar(select(UserDocument).where(UserDocument.id == document_id, UserDocument.user_id == user.id))
     if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="document_not_found")
-    for rel in [(row.original_storage_path or "").strip(), (row.translated_storage_path or "").strip()]:
-        if not rel:
-            continue
-        p = (_DOC_STORAGE_ROOT / rel).resolve()
-        root_abs = _DOC_STORAGE_ROOT.resolve()
-        if (root_abs in p.parents or p == root_abs) and p.exists() and p.is_file():
-            try:
-                p.unlink()
-            except Exception:
-                logger.warning("document_file_delete_failed path=%s", p, exc_info=True)
+    _remove_stored_file(row.original_storage_path)
+    _remove_stored_file(row.translated_storage_path)
     db.delete(row)
     db.commit()
     return OkResponse(ok=True)
@@ -1131,13 +1200,11 @@ def issue_math_captcha(request: Request) -> MathCaptchaIssueResponse:
 def register(request: Request, payload: RegisterRequest, db: Session = Depends(get_db)) -> OkResponse:
     _require_slide(captcha_id=payload.captcha_id, piece_final_x=payload.piece_final_x)
 
-    existing = db.scalar(select(User).where(User.email == str(payload.email).lower()))
-    if existing:
+    if db.scalar(select(exists().where(User.email == str(payload.email).lower()))):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="email_already_registered")
 
     name = payload.username
-    taken_name = db.scalar(select(User).where(User.username == name))
-    if taken_name:
+    if db.scalar(select(exists().where(User.username == name))):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="username_taken")
 
     user = User(
@@ -1185,17 +1252,18 @@ def login(
     pair = create_access_token(subject=user.id, extra={"email": user.email})
 
     settings = get_settings()
+    now = now_utc()
     refresh_raw = new_token_raw()
     refresh_hash = token_sha256(refresh_raw)
     refresh = RefreshToken(
         user_id=user.id,
         token_hash=refresh_hash,
-        expires_at=now_utc() + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
+        expires_at=now + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
         user_agent=request.headers.get("user-agent"),
         ip=request.client.host if request.client else None,
     )
     db.add(refresh)
-    user.last_login_at = now_utc()
+    user.last_login_at = now
     db.commit()
 
     response.set_cookie(
@@ -1222,28 +1290,31 @@ def refresh(
     if not raw:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="missing_refresh_cookie")
 
+    now = now_utc()
     hashed = token_sha256(raw)
     token = db.scalar(
-        select(RefreshToken).where(
+        select(RefreshToken)
+        .options(joinedload(RefreshToken.user))
+        .where(
             RefreshToken.token_hash == hashed,
             RefreshToken.revoked_at.is_(None),
-            RefreshToken.expires_at > now_utc(),
+            RefreshToken.expires_at > now,
         )
     )
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_refresh_token")
 
-    user = db.scalar(select(User).where(User.id == token.user_id))
+    user = token.user
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_refresh_token")
 
-    token.revoked_at = now_utc()
+    token.revoked_at = now
     new_raw = new_token_raw()
     new_hash = token_sha256(new_raw)
     new_token = RefreshToken(
         user_id=user.id,
         token_hash=new_hash,
-        expires_at=now_utc() + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
+        expires_at=now + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
         user_agent=request.headers.get("user-agent"),
         ip=request.client.host if request.client else None,
     )
@@ -1290,22 +1361,25 @@ def verify_email(
     response: Response,
     db: Session = Depends(get_db),
 ) -> TokenResponse:
+    now = now_utc()
     hashed = token_sha256(payload.token)
     token = db.scalar(
-        select(EmailVerificationToken).where(
+        select(EmailVerificationToken)
+        .options(joinedload(EmailVerificationToken.user))
+        .where(
             EmailVerificationToken.token_hash == hashed,
             EmailVerificationToken.used_at.is_(None),
-            EmailVerificationToken.expires_at > now_utc(),
+            EmailVerificationToken.expires_at > now,
         )
     )
     if not token:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_or_expired_token")
 
-    user = db.scalar(select(User).where(User.id == token.user_id))
+    user = token.user
     if not user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_or_expired_token")
 
-    token.used_at = now_utc()
+    token.used_at = now
     user.is_email_verified = True
     pair = create_access_token(subject=user.id, extra={"email": user.email})
 
@@ -1315,7 +1389,7 @@ def verify_email(
     refresh = RefreshToken(
         user_id=user.id,
         token_hash=refresh_hash,
-        expires_at=now_utc() + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
+        expires_at=now + timedelta(seconds=settings.JWT_REFRESH_TTL_SECONDS),
         user_agent=request.headers.get("user-agent"),
         ip=request.client.host if request.client else None,
     )
@@ -1386,36 +1460,43 @@ def request_password_reset(
 
 @router.post("/reset-password", response_model=OkResponse)
 @limiter.limit("10/minute")
-def reset_password(request: Request, payload: ResetPasswordRequest, db: Session = Depends(get_db)) -> OkResponse:
+def reset_password(
+    request: Request,
+    payload: ResetPasswordRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> OkResponse:
+    now = now_utc()
     hashed = token_sha256(payload.token)
     token = db.scalar(
-        select(PasswordResetToken).where(
+        select(PasswordResetToken)
+        .options(joinedload(PasswordResetToken.user))
+        .where(
             PasswordResetToken.token_hash == hashed,
             PasswordResetToken.used_at.is_(None),
-            PasswordResetToken.expires_at > now_utc(),
+            PasswordResetToken.expires_at > now,
         )
     )
     if not token:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_or_expired_token")
 
-    user = db.scalar(select(User).where(User.id == token.user_id))
+    user = token.user
     if not user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_or_expired_token")
 
-    token.used_at = now_utc()
+    token.used_at = now
     user.password_hash = hash_password(payload.new_password)
 
     db.execute(
         update(RefreshToken)
         .where(RefreshToken.user_id == user.id, RefreshToken.revoked_at.is_(None))
-        .values(revoked_at=now_utc())
+        .values(revoked_at=now)
     )
     db.commit()
     if user.notify_email:
-        try:
-            send_security_alert_email(to_email=user.email, event="密码已重置")
-        except Exception:
-            logger.warning("send_security_alert_email_failed user=%s event=reset_password", user.id, exc_info=True)
+        background_tasks.add_task(
+            _send_security_alert_quietly, user_id=user.id, to_email=user.email, event="密码已重置", tag="reset_password"
+        )
     return OkResponse(ok=True)
 
 
@@ -1424,6 +1505,7 @@ def reset_password(request: Request, payload: ResetPasswordRequest, db: Session
 def change_password(
     request: Request,
     payload: ChangePasswordRequest,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> OkResponse:
@@ -1438,10 +1520,9 @@ def change_password(
     )
     db.commit()
     if user.notify_email:
-        try:
-            send_security_alert_email(to_email=user.email, event="密码已修改")
-        except Exception:
-            logger.warning("send_security_alert_email_failed user=%s event=change_password", user.id, exc_info=True)
+        background_tasks.add_task(
+            _send_security_alert_quietly, user_id=user.id, to_email=user.email, event="密码已修改", tag="change_password"
+        )
     return OkResponse(ok=True)
 
 
@@ -1527,9 +1608,24 @@ def delete_account(
     db.execute(delete(EmailVerificationToken).where(EmailVerificationToken.user_id == user.id))
     db.execute(delete(TranslationActivity).where(TranslationActivity.user_id == user.id))
     db.execute(delete(ApiKey).where(ApiKey.user_id == user.id))
+    stored_paths = db.execute(
+        select(UserDocument.original_storage_path, UserDocument.translated_storage_path).where(
+            UserDocument.user_id == user.id
+        )
+    ).all()
+    db.execute(delete(UserDocument).where(UserDocument.user_id == user.id))
     db.execute(delete(User).where(User.id == user.id))
     db.commit()
 
+    # The rows were the only reference to the uploads; remove the files once the delete is committed.
+    for original_path, translated_path in stored_paths:
+        _remove_stored_file(original_path)
+        _remove_stored_file(translated_path)
+    user_dir = _DOC_STORAGE_ROOT_ABS / user.id
+    shutil.rmtree(user_dir, ignore_errors=True)
+    if user_dir.exists():
+        logger.warning("document_dir_delete_failed path=%s", user_dir)
+
     settings = get_settings()
     response.delete_cookie(key=settings.REFRESH_COOKIE_NAME, path=settings.REFRESH_COOKIE_PATH)
     return OkResponse(ok=True)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional, Tuple
+
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+
+class SecondCachedFormatter(logging.Formatter):
+    """
+    Same output as logging.Formatter's default asctime ("%Y-%m-%d %H:%M:%S,mmm",
+    local time), but the strftime part is computed once per wall-clock second
+    instead of once per record.
+    """
+
+    _cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cache
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            # Single tuple assignment so concurrent handlers never see a torn pair.
+            self._cache = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    # Mirrors logging.basicConfig: a no-op when the root logger is already configured.
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(SecondCachedFormatter(LOG_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(level)
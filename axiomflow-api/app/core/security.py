@@ -3,10 +3,16 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
+import json
+import logging
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -14,7 +20,42 @@ from passlib.context import CryptContext
 from app.core.config import get_settings
 
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+logger = logging.getLogger("axiomflow.security")
+
+# passlib's argon2 defaults; configured costs below these only make sense outside prod.
+_ARGON2_MIN_TIME_COST = 3
+_ARGON2_MIN_MEMORY_KIB = 65536
+
+
+def _build_pwd_context() -> CryptContext:
+    # Existing hashes keep verifying after a cost change: argon2 stores its parameters in the hash.
+    settings = get_settings()
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        argon2__time_cost=settings.PASSWORD_HASH_TIME_COST,
+        argon2__memory_cost=settings.PASSWORD_HASH_MEMORY_KIB,
+        argon2__parallelism=settings.PASSWORD_HASH_PARALLELISM,
+    )
+
+
+pwd_context = _build_pwd_context()
+
+
+def warn_if_weak_password_hashing() -> None:
+    settings = get_settings()
+    if (settings.APP_ENV or "").lower() in ("dev", "test"):
+        return
+    if (
+        settings.PASSWORD_HASH_TIME_COST < _ARGON2_MIN_TIME_COST
+        or settings.PASSWORD_HASH_MEMORY_KIB < _ARGON2_MIN_MEMORY_KIB
+    ):
+        logger.warning(
+            "password_hash_cost_below_recommended env=%s time_cost=%s memory_kib=%s",
+            settings.APP_ENV,
+            settings.PASSWORD_HASH_TIME_COST,
+            settings.PASSWORD_HASH_MEMORY_KIB,
+        )
 
 
 def now_utc() -> datetime:
@@ -37,13 +78,16 @@ def new_token_raw(nbytes: int = 32) -> str:
     return _b64url(secrets.token_bytes(nbytes))
 
 
+_CODE_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
 def new_code_raw(length: int = 6) -> str:
     """
     Generate a short human-enterable code.
     Used for password reset "verification code".
     """
-    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    choice = secrets.choice
+    return "".join([choice(_CODE_ALPHABET) for _ in range(length)])
 
 
 def token_sha256(token_raw: str) -> str:
@@ -51,46 +95,117 @@ def token_sha256(token_raw: str) -> str:
     return hashlib.sha256(token_raw.encode("utf-8")).hexdigest()
 
 
+# Same compact header python-jose emits for HS256: {"alg":"HS256","typ":"JWT"}
+_HS256_HEADER_B64 = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+
+
+@lru_cache(maxsize=4)
+def _hs256_keyed(secret: str) -> "hmac.HMAC":
+    # HMAC key setup (ipad/opad blocks) runs once per secret; callers .copy() it.
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _encode_hs256(claims: Dict[str, Any], secret: str) -> str:
+    """Byte-for-byte equivalent of ``jose.jwt.encode(claims, secret, algorithm="HS256")``."""
+    body = _b64url(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+    signing_input = f"{_HS256_HEADER_B64}.{body}"
+    mac = _hs256_keyed(secret).copy()
+    mac.update(signing_input.encode("ascii"))
+    return f"{signing_input}.{_b64url(mac.digest())}"
+
+
 @dataclass(frozen=True)
 class JwtPair:
     access_token: str
     access_expires_at: datetime
 
 
-def create_access_token(*, subject: str, extra: Optional[Dict[str, Any]] = None) -> JwtPair:
+@dataclass(frozen=True)
+class _JwtConfig:
+    secret: str
+    issuer: str
+    audience: str
+    access_ttl_seconds: int
+
+
+def _load_jwt_config() -> _JwtConfig:
     settings = get_settings()
-    exp = now_utc() + timedelta(seconds=settings.JWT_ACCESS_TTL_SECONDS)
+    return _JwtConfig(
+        secret=settings.JWT_SECRET,
+        issuer=settings.JWT_ISSUER,
+        audience=settings.JWT_AUDIENCE,
+        access_ttl_seconds=settings.JWT_ACCESS_TTL_SECONDS,
+    )
+
+
+# Read once at import; token issue/verify run on every authenticated request.
+_jwt_config = _load_jwt_config()
+
+
+def create_access_token(*, subject: str, extra: Optional[Dict[str, Any]] = None) -> JwtPair:
+    cfg = _jwt_config
+    # One clock read; claims are integer epoch seconds so no datetime math is needed.
+    iat = int(time.time())
+    exp = iat + cfg.access_ttl_seconds
     payload: Dict[str, Any] = {
-        "iss": settings.JWT_ISSUER,
-        "aud": settings.JWT_AUDIENCE,
+        "iss": cfg.issuer,
+        "aud": cfg.audience,
         "sub": subject,
-        "exp": int(exp.timestamp()),
-        "iat": int(now_utc().timestamp()),
+        "exp": exp,
+        "iat": iat,
         "typ": "access",
     }
     if extra:
         payload.update(extra)
 
-    token = jwt.encode(payload, settings.JWT_SECRET, algorithm="HS256")
-    return JwtPair(access_token=token, access_expires_at=exp)
+    token = _encode_hs256(payload, cfg.secret)
+    return JwtPair(access_token=token, access_expires_at=datetime.fromtimestamp(exp, timezone.utc))
+
+
+_DECODE_CACHE_MAX = 4096
+_DECODE_CACHE_TTL_SECONDS = 60
+_decode_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+_decode_cache_lock = threading.Lock()
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
-    settings = get_settings()
+    """
+    Verify an access token. Successfully verified tokens are remembered for up
+    to 60s (never past their own ``exp``), so clients reusing one bearer token
+    skip the HMAC check and JSON parse; failures are never cached.
+    """
+    now = time.time()
+    with _decode_cache_lock:
+        hit = _decode_cache.get(token)
+        if hit is not None:
+            if hit[1] > now:
+                _decode_cache.move_to_end(token)
+                return dict(hit[0])
+            del _decode_cache[token]
+
+    cfg = _jwt_config
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET,
+            cfg.secret,
             algorithms=["HS256"],
-            issuer=settings.JWT_ISSUER,
-            audience=settings.JWT_AUDIENCE,
+            issuer=cfg.issuer,
+            audience=cfg.audience,
             options={"require_sub": True},
         )
     except JWTError as e:
         raise ValueError("invalid_token") from e
     if payload.get("typ") != "access":
         raise ValueError("invalid_token_type")
-    return payload
+
+    expires = now + _DECODE_CACHE_TTL_SECONDS
+    if isinstance(payload.get("exp"), (int, float)):
+        expires = min(expires, float(payload["exp"]))
+    with _decode_cache_lock:
+        _decode_cache[token] = (payload, expires)
+        if len(_decode_cache) > _DECODE_CACHE_MAX:
+            _decode_cache.popitem(last=False)
+    return dict(payload)
 
 
 def constant_time_equals(a: str, b: str) -> bool:
@@ -29,11 +29,16 @@ def ensure_database_exists() -> None:
         return
 
     # Use raw PyMySQL connection without selecting DB, so missing DB won't break startup.
+    # Works for both mysql+pymysql and mysql+mysqldb DSNs, including ?unix_socket=...
+    unix_socket = url.query.get("unix_socket")
+    if isinstance(unix_socket, tuple):
+        unix_socket = unix_socket[-1]
     conn = pymysql.connect(
         host=url.host or "127.0.0.1",
         port=int(url.port or 3306),
         user=url.username,
         password=url.password,
+        unix_socket=unix_socket or None,
         charset="utf8mb4",
         autocommit=True,
     )
@@ -233,6 +238,30 @@ def ensure_user_documents_columns() -> None:
         logger.warning("Could not ensure user_documents storage columns", exc_info=True)
 
 
+def ensure_composite_indexes() -> None:
+    """
+    Best-effort migration: create multi-column indexes declared on the models
+    that existing tables are missing (create_all never alters existing tables).
+    """
+    try:
+        insp = inspect(engine)
+        for table in Base.metadata.sorted_tables:
+            composite = [idx for idx in table.indexes if len(idx.columns) > 1]
+            if not composite or not insp.has_table(table.name):
+                continue
+            existing = {tuple(i.get("column_names") or ()) for i in insp.get_indexes(table.name)}
+            for idx in composite:
+                if tuple(c.name for c in idx.columns) in existing:
+                    continue
+                try:
+                    idx.create(bind=engine)
+                    logger.info("Added index %s on %s", idx.name, table.name)
+                except Exception:
+                    logger.warning("Could not add index %s on %s", idx.name, table.name, exc_info=True)
+    except Exception:
+        logger.warning("Could not ensure composite indexes", exc_info=True)
+
+
 def ensure_database_ready() -> None:
     try:
         ensure_database_exists()
@@ -253,4 +282,5 @@ def ensure_database_ready() -> None:
     ensure_users_notification_columns()
     ensure_users_preference_columns()
     ensure_user_documents_columns()
+    ensure_composite_indexes()
 
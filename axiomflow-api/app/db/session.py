@@ -12,11 +12,17 @@ settings = get_settings()
 
 engine = create_engine(
     settings.MYSQL_DSN,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # LIFO checkout keeps a small hot set of connections busy so the idle tail can age out.
+    pool_use_lifo=True,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
 )
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, class_=Session)
+# expire_on_commit=False: objects stay readable after commit without a reload SELECT;
+# server-generated columns (created_at/updated_at) are still loaded lazily on access.
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False, class_=Session)
 
 
 def get_db() -> Generator[Session, None, None]:
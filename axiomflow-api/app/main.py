@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,27 +11,33 @@ from slowapi.errors import RateLimitExceeded
 
 from app.core.config import get_settings
 from app.core.limiter import limiter
+from app.core.logging_config import setup_logging
+from app.core.security import warn_if_weak_password_hashing
 from app.api.router import api_router
 from app.db.bootstrap import ensure_database_ready
+from app.db.session import engine
+from app.services.http_client import close_http_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Per-worker setup runs at startup rather than at import time.
+    setup_logging(logging.INFO)
+    warn_if_weak_password_hashing()
+    # 自动创建数据库（不再包含迁移脚本执行）
+    ensure_database_ready()
+    yield
+    close_http_client()
+    engine.dispose()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s %(message)s",
-    )
-
-    app = FastAPI(title=settings.APP_NAME)
+    app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-    @app.on_event("startup")
-    def _startup() -> None:
-        # 自动创建数据库（不再包含迁移脚本执行）
-        ensure_database_ready()
-
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins_list,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -12,10 +12,13 @@ from app.models._mixins import TimestampMixin, UuidPrimaryKeyMixin
 
 class ApiKey(Base, UuidPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "api_keys"
-    __table_args__ = {"comment": "API 密钥表：用于第三方调用鉴权"}
+    __table_args__ = (
+        Index("ix_api_keys_user_id_created_at", "user_id", "created_at"),
+        {"comment": "API 密钥表：用于第三方调用鉴权"},
+    )
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False, index=True, comment="关联用户ID"
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, comment="关联用户ID"
     )
     key_hash: Mapped[str] = mapped_column(
         String(64), nullable=False, unique=True, index=True, comment="API Key 哈希"
@@ -15,7 +15,7 @@ class EmailVerificationToken(Base, UuidPrimaryKeyMixin, TimestampMixin):
     __table_args__ = {"comment": "邮箱验证令牌表：用于注册后邮箱激活"}
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False, index=True, comment="关联用户ID"
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True, comment="关联用户ID"
     )
     token_hash: Mapped[str] = mapped_column(
         String(64), nullable=False, unique=True, index=True, comment="邮箱验证Token哈希"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,10 +12,13 @@ from app.models._mixins import TimestampMixin, UuidPrimaryKeyMixin
 
 class PasswordResetToken(Base, UuidPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "password_reset_tokens"
-    __table_args__ = {"comment": "密码重置令牌表：用于忘记密码流程校验"}
+    __table_args__ = (
+        Index("ix_password_reset_tokens_user_id_created_at", "user_id", "created_at"),
+        {"comment": "密码重置令牌表：用于忘记密码流程校验"},
+    )
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False, index=True, comment="关联用户ID"
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, comment="关联用户ID"
     )
     token_hash: Mapped[str] = mapped_column(
         String(64), nullable=False, unique=True, index=True, comment="重置密码Token哈希"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,10 +12,13 @@ from app.models._mixins import TimestampMixin, UuidPrimaryKeyMixin
 
 class RefreshToken(Base, UuidPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "refresh_tokens"
-    __table_args__ = {"comment": "刷新令牌表：维护会话续期与设备登录状态"}
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_id_created_at", "user_id", "created_at"),
+        {"comment": "刷新令牌表：维护会话续期与设备登录状态"},
+    )
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False, index=True, comment="关联用户ID"
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, comment="关联用户ID"
     )
     token_hash: Mapped[str] = mapped_column(
         String(64), nullable=False, unique=True, index=True, comment="Refresh Token 哈希"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -9,10 +9,13 @@ from app.models._mixins import TimestampMixin, UuidPrimaryKeyMixin
 
 class TranslationActivity(Base, UuidPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "translation_activities"
-    __table_args__ = {"comment": "翻译活动表：记录用户翻译行为用于统计"}
+    __table_args__ = (
+        Index("ix_translation_activities_user_id_created_at", "user_id", "created_at"),
+        {"comment": "翻译活动表：记录用户翻译行为用于统计"},
+    )
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False, index=True, comment="关联用户ID"
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, comment="关联用户ID"
     )
     document_count: Mapped[int] = mapped_column(
         Integer, nullable=False, default=1, server_default="1", comment="本次翻译文档数"
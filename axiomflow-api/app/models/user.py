@@ -20,8 +20,9 @@ class User(Base, UuidPrimaryKeyMixin, TimestampMixin):
     username: Mapped[Optional[str]] = mapped_column(
         String(64), nullable=True, unique=True, index=True, comment="用户名（展示名，唯一）"
     )
+    # Can hold a data URI of up to ~2MB; deferred so per-request user loads skip it.
     avatar_url: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True, comment="头像 URL（支持第三方登录头像）"
+        Text, nullable=True, deferred=True, comment="头像 URL（支持第三方登录头像）"
     )
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False, comment="密码哈希")
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -9,10 +9,13 @@ from app.models._mixins import TimestampMixin, UuidPrimaryKeyMixin
 
 class UserDocument(Base, UuidPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "user_documents"
-    __table_args__ = {"comment": "用户上传文档记录"}
+    __table_args__ = (
+        Index("ix_user_documents_user_id_created_at", "user_id", "created_at"),
+        {"comment": "用户上传文档记录"},
+    )
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False, index=True, comment="关联用户ID"
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, comment="关联用户ID"
     )
     file_name: Mapped[str] = mapped_column(
         String(255), nullable=False, default="Untitled document", server_default="Untitled document", comment="原始文件名"
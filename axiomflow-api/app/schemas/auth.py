@@ -7,12 +7,13 @@ from typing import Optional
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
 
-_HAS_LETTER_RE = re.compile(r"[A-Za-z]")
-_HAS_DIGIT_RE = re.compile(r"\d")
+# One anchored pass: each lookahead skips non-matching chars to the first letter / digit.
+_PASSWORD_RULE_RE = re.compile(r"(?=[^A-Za-z]*[A-Za-z])(?=\D*\d)")
+_RESET_CODE_RE = re.compile(r"[A-Za-z0-9]{6}")
 
 
 def _validate_password_rule(v: str) -> str:
-    if not _HAS_LETTER_RE.search(v) or not _HAS_DIGIT_RE.search(v):
+    if not _PASSWORD_RULE_RE.match(v):
         raise ValueError("password_must_contain_letter_and_digit")
     return v
 
@@ -74,7 +75,7 @@ class ResetPasswordRequest(BaseModel):
         v = (v or "").strip()
         if len(v) != 6:
             raise ValueError("reset_code_must_be_6_chars")
-        if not re.fullmatch(r"[A-Za-z0-9]{6}", v):
+        if not _RESET_CODE_RE.fullmatch(v):
             raise ValueError("reset_code_must_be_alnum")
         return v
 
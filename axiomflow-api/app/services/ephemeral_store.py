@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import redis
+
+from app.core.config import get_settings
+
+
+_KEY_PREFIX = "axiomflow:"
+_MEMORY_MAX_ENTRIES = 100_000
+
+
+class _MemoryBackend:
+    """
+    Process-local fallback; only correct with a single worker process.
+
+    Entries sit in insertion order, so expired ones are dropped from the old end on
+    each put instead of scanning the whole store; max_entries bounds memory when
+    challenges are issued faster than they expire (abandoned captchas, floods).
+    """
+
+    def __init__(self, max_entries: int = _MEMORY_MAX_ENTRIES) -> None:
+        self._data: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _evict_locked(self, now: float) -> None:
+        data = self._data
+        while data:
+            oldest = next(iter(data))
+            if data[oldest][1] > now and len(data) < self._max_entries:
+                break
+            del data[oldest]
+
+    def put(self, key: str, value: str, ttl_seconds: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._evict_locked(now)
+            self._data[key] = (value, now + ttl_seconds)
+
+    def pop(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.pop(key, None)
+        if item is None or item[1] <= time.time():
+            return None
+        return item[0]
+
+
+class _RedisBackend:
+    """Shared across workers and instances; Redis expires entries itself."""
+
+    def __init__(self, url: str) -> None:
+        self._client = redis.Redis.from_url(url, decode_responses=True, socket_timeout=2)
+
+    def put(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._client.set(key, value, ex=ttl_seconds)
+
+    def pop(self, key: str) -> Optional[str]:
+        # GET + DEL in one MULTI: a value is handed out at most once, on any Redis version.
+        pipe = self._client.pipeline(transaction=True)
+        pipe.get(key)
+        pipe.delete(key)
+        value, _ = pipe.execute()
+        return value
+
+
+@lru_cache(maxsize=1)
+def _backend() -> _MemoryBackend | _RedisBackend:
+    url = (get_settings().REDIS_URL or "").strip()
+    if url:
+        return _RedisBackend(url)
+    return _MemoryBackend()
+
+
+def put(namespace: str, key: str, value: str, *, ttl_seconds: int) -> None:
+    _backend().put(f"{_KEY_PREFIX}{namespace}:{key}", value, ttl_seconds)
+
+
+def pop(namespace: str, key: str) -> Optional[str]:
+    """Return and delete the value; None when missing or expired (single use)."""
+    return _backend().pop(f"{_KEY_PREFIX}{namespace}:{key}")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """
+    Process-wide client for outbound OAuth/avatar calls. Keep-alive connections to
+    the provider hosts are reused across callbacks instead of a new TCP + TLS
+    handshake per request. httpx.Client is safe to share between worker threads.
+    """
+    return httpx.Client(
+        # HTTP/2 when the provider offers it (api.github.com, googleapis): concurrent
+        # calls to one host multiplex on a single connection. Needs the h2 package.
+        http2=True,
+        timeout=12,
+        # urlopen followed redirects; avatar hosts rely on that.
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+        headers={"User-Agent": "AxiomFlow-OAuth/1.0"},
+    )
+
+
+def close_http_client() -> None:
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+        get_http_client.cache_clear()
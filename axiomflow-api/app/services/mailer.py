@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import logging
+import queue
+import random
+import re
 import smtplib
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from email.message import EmailMessage
-from typing import Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from app.core.config import get_settings
 
 
 logger = logging.getLogger("axiomflow.mailer")
 
+_TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
 
 def _parse_from(from_value: str) -> Tuple[Optional[str], str]:
     # Very small parser: "Name <email>" or "email"
@@ -21,10 +33,39 @@ def _parse_from(from_value: str) -> Tuple[Optional[str], str]:
     return (None, v)
 
 
-def send_email(*, to_email: str, subject: str, text: str, html: Optional[str] = None) -> None:
+@dataclass(frozen=True)
+class _SmtpProfile:
+    from_name: Optional[str]
+    from_email: str
+    # QQ/163 commonly use implicit SSL on 465; other ports (e.g. 587) use SMTP + optional STARTTLS.
+    implicit_ssl: bool
+
+
+@lru_cache(maxsize=1)
+def _smtp_profile() -> _SmtpProfile:
+    # Settings are fixed for the process, so parse the sender and pick the transport once.
     settings = get_settings()
     from_name, from_email = _parse_from(settings.SMTP_FROM_EMAIL)
+    return _SmtpProfile(from_name=from_name, from_email=from_email, implicit_ssl=int(settings.SMTP_PORT) == 465)
+
 
+def _needs_smtputf8(*addresses: str) -> bool:
+    return not all(a.isascii() for a in addresses)
+
+
+def _build_message(
+    *,
+    from_email: str,
+    from_name: Optional[str],
+    to_email: str,
+    subject: str,
+    text: str,
+    html: Optional[str],
+) -> bytes:
+    """
+    Serialize the message once, with CRLF line endings, so the same bytes can be
+    handed to the SMTP DATA phase on every (re)transmission attempt.
+    """
     msg = EmailMessage()
     msg["Subject"] = subject
     msg["To"] = to_email
@@ -32,32 +73,319 @@ def send_email(*, to_email: str, subject: str, text: str, html: Optional[str] =
     msg.set_content(text)
     if html:
         msg.add_alternative(html, subtype="html")
+    policy = msg.policy.clone(linesep="\r\n", utf8=_needs_smtputf8(from_email, to_email))
+    return msg.as_bytes(policy=policy)
 
-    try:
-        # QQ/163 commonly use implicit SSL on 465.
-        if int(settings.SMTP_PORT) == 465:
-            with smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT, timeout=15) as smtp:
-                smtp.ehlo()
-                if settings.SMTP_USERNAME:
-                    smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-                smtp.send_message(msg)
-            return
 
-        # Other ports (e.g. 587) use SMTP + optional STARTTLS.
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=15) as smtp:
+_DOT_LINE_RE = re.compile(rb"(?m)^\.")
+
+
+class _PipeliningMixin:
+    """
+    RFC 2920 PIPELINING: send MAIL FROM, every RCPT TO and DATA in a single
+    write, then read the replies in order. Falls back to the stock smtplib
+    dialogue when the server does not advertise the extension.
+    """
+
+    use_pipelining = True
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):  # type: ignore[no-untyped-def]
+        self.ehlo_or_helo_if_needed()
+        if not (self.use_pipelining and self.has_extn("pipelining")) or not isinstance(msg, bytes):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+
+        options = [f"size={len(msg)}"] if self.has_extn("size") else []
+        options.extend(mail_options)
+        if any(o.lower() == "smtputf8" for o in options):
+            if not self.has_extn("smtputf8"):
+                raise smtplib.SMTPNotSupportedError("SMTPUTF8 not supported by server")
+            self.command_encoding = "utf-8"
+        mail_opts = (" " + " ".join(options)) if options else ""
+        rcpt_opts = (" " + " ".join(rcpt_options)) if rcpt_options else ""
+
+        lines = [f"mail FROM:{smtplib.quoteaddr(from_addr)}{mail_opts}\r\n"]
+        lines.extend(f"rcpt TO:{smtplib.quoteaddr(r)}{rcpt_opts}\r\n" for r in to_addrs)
+        lines.append("data\r\n")
+        self.send("".join(lines))
+
+        mail_code, mail_resp = self.getreply()
+        refused = {}
+        for rcpt in to_addrs:
+            code, resp = self.getreply()
+            if code not in (250, 251):
+                refused[rcpt] = (code, resp)
+        data_code, data_resp = self.getreply()
+
+        if mail_code != 250 or len(refused) == len(to_addrs) or data_code != 354:
+            if data_code == 354:
+                # Server accepted DATA anyway; end the (empty) body before resetting.
+                self.send(".\r\n")
+                self.getreply()
+            if mail_code == 421 or data_code == 421:
+                self.close()
+            else:
+                self._rset()
+            if mail_code != 250:
+                raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+            if len(refused) == len(to_addrs):
+                raise smtplib.SMTPRecipientsRefused(refused)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        body = _DOT_LINE_RE.sub(b"..", msg)
+        if not body.endswith(b"\r\n"):
+            body += b"\r\n"
+        self.send(body + b".\r\n")
+        code, resp = self.getreply()
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+
+
+_dns_lock = threading.Lock()
+_dns_cache: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+
+
+def _resolve_cached(host: str, port: int) -> List[str]:
+    ttl = get_settings().SMTP_DNS_CACHE_SECONDS
+    now = time.monotonic()
+    key = (host, port)
+    with _dns_lock:
+        hit = _dns_cache.get(key)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    addrs = list(dict.fromkeys(info[4][0] for info in infos))
+    if ttl > 0:
+        with _dns_lock:
+            _dns_cache[key] = (addrs, now + ttl)
+    return addrs
+
+
+def _forget_resolved(host: str, port: int) -> None:
+    with _dns_lock:
+        _dns_cache.pop((host, port), None)
+
+
+class _CachedDnsMixin:
+    """
+    Connect to a cached address for the SMTP host. smtplib keeps the hostname
+    in ``self._host``, so STARTTLS / implicit-SSL SNI and certificate checks
+    still use the name rather than the IP.
+    """
+
+    def _get_socket(self, host, port, timeout):  # type: ignore[no-untyped-def]
+        err: Optional[OSError] = None
+        for addr in _resolve_cached(host, port):
+            try:
+                return super()._get_socket(addr, port, timeout)
+            except OSError as exc:
+                err = exc
+        # Every cached address failed (or none resolved): re-resolve next time.
+        _forget_resolved(host, port)
+        raise err or OSError(f"cannot resolve {host}")
+
+
+class _SMTP(_CachedDnsMixin, _PipeliningMixin, smtplib.SMTP):
+    pass
+
+
+class _SMTP_SSL(_CachedDnsMixin, _PipeliningMixin, smtplib.SMTP_SSL):
+    pass
+
+
+def _connect() -> smtplib.SMTP:
+    settings = get_settings()
+    implicit_ssl = _smtp_profile().implicit_ssl
+    smtp_cls = _SMTP_SSL if implicit_ssl else _SMTP
+    smtp = smtp_cls(settings.SMTP_HOST, settings.SMTP_PORT, timeout=15)
+    smtp.use_pipelining = settings.SMTP_PIPELINING
+    try:
+        if settings.SMTP_DEBUG_LEVEL:
+            smtp.set_debuglevel(settings.SMTP_DEBUG_LEVEL)
+        smtp.ehlo()
+        if not implicit_ssl and settings.SMTP_USE_TLS:
+            smtp.starttls()
             smtp.ehlo()
-            if settings.SMTP_USE_TLS:
-                smtp.starttls()
-                smtp.ehlo()
-            if settings.SMTP_USERNAME:
-                smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-            smtp.send_message(msg)
+        if settings.SMTP_USERNAME:
+            smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
     except Exception:
-        logger.exception("smtp_send_failed")
+        smtp.close()
         raise
+    return smtp
+
+
+def _close_quietly(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+@dataclass
+class _PooledConnection:
+    smtp: smtplib.SMTP
+    born_at: float
+    sent: int = 0
+
+
+class _SmtpPool:
+    """
+    Bounded pool of authenticated SMTP connections for the configured server.
+
+    Connections are recycled after ``max_messages`` sends or ``max_age``
+    seconds, probed with NOOP before reuse, and dropped on any send error.
+    """
+
+    def __init__(self, *, max_size: int, max_messages: int = 100, max_age: float = 100.0) -> None:
+        self._idle: "queue.LifoQueue[_PooledConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._max_messages = max_messages
+        self._max_age = max_age
+
+    def _expired(self, conn: _PooledConnection) -> bool:
+        return conn.sent >= self._max_messages or time.monotonic() - conn.born_at > self._max_age
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return _PooledConnection(smtp=_connect(), born_at=time.monotonic())
+            if self._expired(conn):
+                _close_quietly(conn.smtp)
+                continue
+            try:
+                code, _ = conn.smtp.noop()
+            except (smtplib.SMTPException, OSError):
+                conn.smtp.close()
+                continue
+            if code == 250:
+                return conn
+            _close_quietly(conn.smtp)
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        with self._slots:
+            conn = self._checkout()
+            try:
+                yield conn.smtp
+            except BaseException:
+                # The SMTP dialogue may be mid-transaction; never hand it out again.
+                conn.smtp.close()
+                raise
+            conn.sent += 1
+            if self._expired(conn):
+                _close_quietly(conn.smtp)
+            else:
+                self._idle.put(conn)
+
+
+@lru_cache(maxsize=1)
+def _get_pool() -> Optional[_SmtpPool]:
+    size = get_settings().SMTP_POOL_SIZE
+    return _SmtpPool(max_size=size) if size > 0 else None
+
+
+def _transmit(*, from_email: str, to_email: str, raw: bytes) -> None:
+    mail_options = ("SMTPUTF8", "BODY=8BITMIME") if _needs_smtputf8(from_email, to_email) else ()
+    pool = _get_pool()
+    if pool is None:
+        smtp = _connect()
+        try:
+            smtp.sendmail(from_email, [to_email], raw, mail_options)
+        finally:
+            _close_quietly(smtp)
+        return
+
+    with pool.connection() as smtp:
+        smtp.sendmail(from_email, [to_email], raw, mail_options)
+
+
+def _email_disabled(kind: str) -> bool:
+    if get_settings().SMTP_ENABLED:
+        return False
+    logger.debug("smtp_disabled skip=%s", kind)
+    return True
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Connection drops, timeouts and 4xx replies are worth retrying; auth failures and 5xx are not."""
+    if isinstance(exc, smtplib.SMTPAuthenticationError):
+        return False
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    # SMTPException subclasses OSError; only plain socket errors/timeouts are transient here.
+    return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
+
+
+def send_email(*, to_email: str, subject: str, text: str, html: Optional[str] = None) -> None:
+    if _email_disabled("send_email"):
+        return
+    settings = get_settings()
+    profile = _smtp_profile()
+    from_email = profile.from_email
+    raw = _build_message(
+        from_email=from_email,
+        from_name=profile.from_name,
+        to_email=to_email,
+        subject=subject,
+        text=text,
+        html=html,
+    )
+
+    attempts = settings.SMTP_MAX_ATTEMPTS
+    for attempt in range(attempts):
+        try:
+            _transmit(from_email=from_email, to_email=to_email, raw=raw)
+            return
+        except Exception as exc:
+            if attempt + 1 >= attempts or not _is_transient(exc):
+                logger.exception("smtp_send_failed attempts=%d", attempt + 1)
+                raise
+            # Full jitter keeps concurrent retries from re-synchronizing.
+            delay = random.uniform(0, min(settings.SMTP_RETRY_MAX_SECONDS, settings.SMTP_RETRY_BASE_SECONDS * 2**attempt))
+            logger.warning("smtp_send_retry attempt=%d delay=%.2fs error=%r", attempt + 1, delay, exc)
+            time.sleep(delay)
+
+
+def _wants_html(to_email: str) -> bool:
+    settings = get_settings()
+    if not settings.SMTP_SEND_HTML:
+        return False
+    domain = to_email.rpartition("@")[2].strip().lower()
+    return domain not in settings.smtp_text_only_domains_set
+
+
+@lru_cache(maxsize=None)
+def _template(name: str) -> str:
+    # Read each template from disk once per process.
+    return (_TEMPLATE_DIR / name).read_text(encoding="utf-8").strip()
+
+
+def _render(template: str, *substitutions: Tuple[str, str]) -> str:
+    """
+    Fill sentinel placeholders (``__NAME__``) with one str.replace pass each.
+    Sentinels avoid escaping CSS braces; pass free-text values last so their
+    content is never re-scanned for later placeholders.
+    """
+    for placeholder, value in substitutions:
+        template = template.replace(placeholder, value)
+    return template
 
 
 def send_verification_email(*, to_email: str, token: str) -> None:
+    if _email_disabled("verification_email"):
+        return
     settings = get_settings()
     link = f"{settings.PUBLIC_WEB_URL}/#/verify-email?token={token}"
     subject = "Axiomflow 邮箱验证"
@@ -68,59 +396,13 @@ def send_verification_email(*, to_email: str, token: str) -> None:
         "该链接将在 60 分钟后过期。\n"
         "如果这不是你的操作，请忽略这封邮件。"
     )
-    html = f"""\
-<!doctype html>
-<html lang="zh-CN">
-  <body style="margin:0;padding:0;background:#f3f6fb;">
-    <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="100%" style="background:#f3f6fb;padding:28px 12px;">
-      <tr>
-        <td align="center">
-          <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="640" style="width:640px;max-width:640px;background:#ffffff;border-radius:16px;overflow:hidden;border:1px solid #e9eef7;">
-            <tr>
-              <td style="padding:28px 32px 18px;background:linear-gradient(120deg,#4f46e5,#7c3aed);">
-                <div style="font-size:12px;letter-spacing:.08em;color:#e0e7ff;font-weight:700;">AXIOMFLOW</div>
-                <div style="margin-top:8px;font-size:24px;line-height:1.3;color:#ffffff;font-weight:700;">邮箱验证</div>
-                <div style="margin-top:8px;font-size:14px;line-height:1.6;color:#e0e7ff;">确认你的邮箱后即可完整使用账号功能。</div>
-              </td>
-            </tr>
-            <tr>
-              <td style="padding:28px 32px 8px;font-family:Arial,'PingFang SC','Microsoft YaHei',sans-serif;color:#0f172a;">
-                <p style="margin:0 0 16px;font-size:15px;line-height:1.8;color:#334155;">你好，</p>
-                <p style="margin:0 0 18px;font-size:15px;line-height:1.8;color:#334155;">
-                  请点击下方按钮完成邮箱验证。
-                </p>
-                <table role="presentation" cellpadding="0" cellspacing="0" border="0" style="margin:0 0 20px;">
-                  <tr>
-                    <td align="center" bgcolor="#4f46e5" style="border-radius:10px;">
-                      <a href="{link}" style="display:inline-block;padding:12px 22px;color:#ffffff;text-decoration:none;font-size:14px;font-weight:700;">
-                        验证邮箱
-                      </a>
-                    </td>
-                  </tr>
-                </table>
-                <p style="margin:0 0 14px;font-size:13px;color:#94a3b8;">该链接有效期为 60 分钟。</p>
-              </td>
-            </tr>
-            <tr>
-              <td style="padding:16px 32px 26px;border-top:1px solid #eef2f7;font-family:Arial,'PingFang SC','Microsoft YaHei',sans-serif;">
-                <p style="margin:0;font-size:12px;line-height:1.8;color:#94a3b8;">
-                  若非本人操作，请忽略此邮件。<br/>
-                  此邮件由系统自动发送，请勿直接回复。<br/>
-                  联系邮箱：support@axiomflow.com
-                </p>
-              </td>
-            </tr>
-          </table>
-        </td>
-      </tr>
-    </table>
-  </body>
-</html>
-""".strip()
+    html = _render(_template("verification_email.html"), ("__LINK__", link)) if _wants_html(to_email) else None
     send_email(to_email=to_email, subject=subject, text=text, html=html)
 
 
 def send_password_reset_email(*, to_email: str, token: str) -> None:
+    if _email_disabled("password_reset_email"):
+        return
     settings = get_settings()
     link = f"{settings.PUBLIC_WEB_URL}/#/reset-password?token={token}"
     subject = "Axiomflow 重置密码"
@@ -132,100 +414,26 @@ def send_password_reset_email(*, to_email: str, token: str) -> None:
         "如果这不是你的操作，请忽略这封邮件。"
     )
 
-    html = f"""\
-<!doctype html>
-<html lang="zh-CN">
-  <body style="margin:0;padding:0;background:#f3f6fb;">
-    <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="100%" style="background:#f3f6fb;padding:28px 12px;">
-      <tr>
-        <td align="center">
-          <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="640" style="width:640px;max-width:640px;background:#ffffff;border-radius:16px;overflow:hidden;border:1px solid #e9eef7;">
-            <tr>
-              <td style="padding:28px 32px 18px;background:linear-gradient(120deg,#0f172a,#334155);">
-                <div style="font-size:12px;letter-spacing:.08em;color:#cbd5e1;font-weight:700;">AXIOMFLOW</div>
-                <div style="margin-top:8px;font-size:24px;line-height:1.3;color:#ffffff;font-weight:700;">重置密码</div>
-                <div style="margin-top:8px;font-size:14px;line-height:1.6;color:#cbd5e1;">验证码将在 30 分钟后过期</div>
-              </td>
-            </tr>
-            <tr>
-              <td style="padding:28px 32px 8px;font-family:Arial,'PingFang SC','Microsoft YaHei',sans-serif;color:#0f172a;">
-                <p style="margin:0 0 16px;font-size:15px;line-height:1.8;color:#334155;">你好，</p>
-                <p style="margin:0 0 18px;font-size:15px;line-height:1.8;color:#334155;">
-                  系统收到了重置密码请求。请使用下方“验证码”完成重置。
-                </p>
-
-                <table role="presentation" cellpadding="0" cellspacing="0" border="0" style="margin:0 0 20px;">
-                  <tr>
-                    <td align="center" bgcolor="#f8fafc" style="border-radius:12px;padding:16px 18px;border:1px solid #e5e7eb;">
-                      <div style="font-size:12px;letter-spacing:.08em;color:#64748b;font-weight:700;margin-bottom:8px;">验证码</div>
-                      <div style="font-family:ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,'Liberation Mono','Courier New',monospace;font-size:15px;line-height:1.5;color:#0f172a;font-weight:800;word-break:break-all;">
-                        {token}
-                      </div>
-                    </td>
-                  </tr>
-                </table>
-
-                <p style="margin:0 0 14px;font-size:13px;color:#94a3b8;">该验证码用于本次重置密码请求。</p>
-              </td>
-            </tr>
-            <tr>
-              <td style="padding:16px 32px 26px;border-top:1px solid #eef2f7;font-family:Arial,'PingFang SC','Microsoft YaHei',sans-serif;">
-                <p style="margin:0;font-size:12px;line-height:1.8;color:#94a3b8;">
-                  若非本人操作，请忽略此邮件。<br/>
-                  此邮件由系统自动发送，请勿直接回复。<br/>
-                  联系邮箱：support@axiomflow.com
-                </p>
-              </td>
-            </tr>
-          </table>
-        </td>
-      </tr>
-    </table>
-  </body>
-</html>
-""".strip()
+    html = _render(_template("password_reset_email.html"), ("__TOKEN__", token)) if _wants_html(to_email) else None
     send_email(to_email=to_email, subject=subject, text=text, html=html)
 
 
 def send_security_alert_email(*, to_email: str, event: str) -> None:
+    if _email_disabled("security_alert_email"):
+        return
     subject = "Axiomflow 安全提醒"
     text = (
         "Axiomflow 安全提醒\n\n"
         f"检测到你的账户发生安全相关操作：{event}\n"
         "如果这不是你本人操作，请尽快修改密码并检查账户安全。"
     )
-    html = f"""\
-<!doctype html>
-<html lang="zh-CN">
-  <body style="margin:0;padding:0;background:#f3f6fb;">
-    <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="100%" style="background:#f3f6fb;padding:28px 12px;">
-      <tr>
-        <td align="center">
-          <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="640" style="width:640px;max-width:640px;background:#ffffff;border-radius:16px;overflow:hidden;border:1px solid #e9eef7;">
-            <tr>
-              <td style="padding:24px 32px;background:linear-gradient(120deg,#b91c1c,#ef4444);color:#fff;">
-                <div style="font-size:12px;letter-spacing:.08em;font-weight:700;">AXIOMFLOW</div>
-                <div style="margin-top:8px;font-size:22px;font-weight:700;">安全提醒</div>
-              </td>
-            </tr>
-            <tr>
-              <td style="padding:24px 32px;font-family:Arial,'PingFang SC','Microsoft YaHei',sans-serif;color:#0f172a;">
-                <p style="margin:0 0 12px;font-size:15px;line-height:1.8;">检测到你的账户发生安全相关操作：</p>
-                <p style="margin:0 0 14px;font-size:16px;line-height:1.8;font-weight:700;color:#b91c1c;">{event}</p>
-                <p style="margin:0;font-size:13px;color:#64748b;line-height:1.8;">如果这不是你本人操作，请尽快修改密码并检查账户安全设置。</p>
-              </td>
-            </tr>
-          </table>
-        </td>
-      </tr>
-    </table>
-  </body>
-</html>
-""".strip()
+    html = _render(_template("security_alert_email.html"), ("__EVENT__", event)) if _wants_html(to_email) else None
     send_email(to_email=to_email, subject=subject, text=text, html=html)
 
 
 def send_translation_completed_email(*, to_email: str, title: str, document_count: int, word_count: int) -> None:
+    if _email_disabled("translation_completed_email"):
+        return
     subject = "Axiomflow 翻译完成通知"
     text = (
         "Axiomflow 翻译完成通知\n\n"
@@ -234,34 +442,13 @@ def send_translation_completed_email(*, to_email: str, title: str, document_coun
         f"字数：{word_count}\n\n"
         "你可以登录 Axiomflow 查看翻译结果。"
     )
-    html = f"""\
-<!doctype html>
-<html lang="zh-CN">
-  <body style="margin:0;padding:0;background:#f3f6fb;">
-    <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="100%" style="background:#f3f6fb;padding:28px 12px;">
-      <tr>
-        <td align="center">
-          <table role="presentation" cellpadding="0" cellspacing="0" border="0" width="640" style="width:640px;max-width:640px;background:#ffffff;border-radius:16px;overflow:hidden;border:1px solid #e9eef7;">
-            <tr>
-              <td style="padding:24px 32px;background:linear-gradient(120deg,#4f46e5,#7c3aed);color:#fff;">
-                <div style="font-size:12px;letter-spacing:.08em;font-weight:700;">AXIOMFLOW</div>
-                <div style="margin-top:8px;font-size:22px;font-weight:700;">翻译任务已完成</div>
-              </td>
-            </tr>
-            <tr>
-              <td style="padding:24px 32px;font-family:Arial,'PingFang SC','Microsoft YaHei',sans-serif;color:#0f172a;">
-                <p style="margin:0 0 8px;font-size:15px;line-height:1.8;">任务：{title}</p>
-                <p style="margin:0 0 8px;font-size:15px;line-height:1.8;">文档数：{document_count}</p>
-                <p style="margin:0 0 12px;font-size:15px;line-height:1.8;">字数：{word_count}</p>
-                <p style="margin:0;font-size:13px;color:#64748b;line-height:1.8;">你可以登录 Axiomflow 查看翻译结果。</p>
-              </td>
-            </tr>
-          </table>
-        </td>
-      </tr>
-    </table>
-  </body>
-</html>
-""".strip()
+    html = None
+    if _wants_html(to_email):
+        html = _render(
+            _template("translation_completed_email.html"),
+            ("__DOCUMENT_COUNT__", str(document_count)),
+            ("__WORD_COUNT__", str(word_count)),
+            ("__TITLE__", title),
+        )
     send_email(to_email=to_email, subject=subject, text=text, html=html)
 
@@ -1,27 +1,14 @@
 from __future__ import annotations
 
 import secrets
-import threading
-import time
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Tuple
 
-
-@dataclass
-class MathChallenge:
-    answer: int
-    expires_at: float
+from app.core.security import constant_time_equals
+from app.services import ephemeral_store
 
 
 _TTL_SECONDS = 300
-_store: Dict[str, MathChallenge] = {}
-_lock = threading.Lock()
-
-
-def _purge_locked(now: float) -> None:
-    dead = [k for k, v in _store.items() if v.expires_at <= now]
-    for k in dead:
-        del _store[k]
+_NAMESPACE = "math_captcha"
 
 
 def issue_math_challenge() -> Tuple[str, int, int]:
@@ -29,18 +16,13 @@ def issue_math_challenge() -> Tuple[str, int, int]:
     a = secrets.randbelow(8) + 2
     b = secrets.randbelow(8) + 2
     cid = secrets.token_urlsafe(16)
-    exp = time.time() + _TTL_SECONDS
-    with _lock:
-        _purge_locked(time.time())
-        _store[cid] = MathChallenge(answer=a + b, expires_at=exp)
+    ephemeral_store.put(_NAMESPACE, cid, str(a + b), ttl_seconds=_TTL_SECONDS)
     return cid, a, b
 
 
 def validate_and_consume_math(*, captcha_id: str, answer: int) -> bool:
-    now = time.time()
-    with _lock:
-        _purge_locked(now)
-        ch = _store.pop(captcha_id, None)
-        if not ch or ch.expires_at <= now:
-            return False
-        return int(answer) == ch.answer
+    stored = ephemeral_store.pop(_NAMESPACE, captcha_id)
+    if stored is None:
+        return False
+    # Compare the canonical decimal strings in constant time; no int() of stored data.
+    return constant_time_equals(str(int(answer)), stored)
@@ -1,42 +1,44 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import hmac
 import secrets
-import threading
-import time
-from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
 
-
-@dataclass
-class OAuthState:
-    provider: str
-    expires_at: float
+from app.core.config import get_settings
+from app.core.security import constant_time_equals
+from app.services import ephemeral_store
 
 
 _TTL_SECONDS = 10 * 60
-_store: Dict[str, OAuthState] = {}
-_lock = threading.Lock()
+_NAMESPACE = "oauth_state"
+
 
+@lru_cache(maxsize=1)
+def _state_key() -> bytes:
+    # Derived so the raw JWT secret is never used directly for a second purpose.
+    return hmac.new(get_settings().JWT_SECRET.encode("utf-8"), b"axiomflow-oauth-state", hashlib.sha256).digest()
 
-def _purge_locked(now: float) -> None:
-    dead = [k for k, v in _store.items() if v.expires_at <= now]
-    for k in dead:
-        del _store[k]
+
+def _sign(provider: str, nonce: str) -> str:
+    mac = hmac.new(_state_key(), f"{provider}.{nonce}".encode("utf-8"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(mac[:16]).rstrip(b"=").decode("ascii")
 
 
 def issue_oauth_state(provider: str) -> str:
-    s = secrets.token_urlsafe(24)
-    with _lock:
-        _purge_locked(time.time())
-        _store[s] = OAuthState(provider=provider, expires_at=time.time() + _TTL_SECONDS)
-    return s
+    """
+    State is "<nonce>.<mac>": the nonce is the single-use store key and the MAC binds
+    it to the provider, so forged or cross-provider states fail before any store lookup.
+    """
+    nonce = secrets.token_urlsafe(24)
+    ephemeral_store.put(_NAMESPACE, nonce, provider, ttl_seconds=_TTL_SECONDS)
+    return f"{nonce}.{_sign(provider, nonce)}"
 
 
 def consume_oauth_state(state: str, provider: str) -> bool:
-    with _lock:
-        _purge_locked(time.time())
-        obj = _store.pop(state, None)
-        if not obj:
-            return False
-        return obj.provider == provider and obj.expires_at > time.time()
-
+    nonce, sep, mac = (state or "").partition(".")
+    if not sep or not nonce or not constant_time_equals(mac, _sign(provider, nonce)):
+        return False
+    stored = ephemeral_store.pop(_NAMESPACE, nonce)
+    return stored is not None and stored == provider
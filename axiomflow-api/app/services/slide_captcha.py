@@ -4,30 +4,43 @@ import io
 import secrets
 import threading
 import time
-from urllib.request import Request, urlopen
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from urllib.request import Request, urlopen
+from typing import Deque, Tuple
 
 from PIL import Image, ImageDraw, ImageOps
 from app.core.config import get_settings
+from app.services import ephemeral_store
 
 
-@dataclass
-class SlideChallenge:
-    target_x: int
-    target_y: int
-    expires_at: float
+_TTL_SECONDS = 300
+_NAMESPACE = "slide_captcha"
+# zlib level 3 without optimize: noise backgrounds barely compress, so higher levels
+# only burn CPU, and photo backgrounds took ~240 ms at level 9 + optimize vs ~7 ms here.
+_PNG_SAVE_OPTIONS = {"format": "PNG", "compress_level": 3}
+
+# Remote backgrounds are fetched into a small rotating pool instead of once per
+# challenge: each entry serves _BG_MAX_USES challenges, then its slot is refetched.
+# The pool holds source images, not per-size fits: scene size comes from the client,
+# so keying by size would keep one fetched image per size ever requested.
+_BG_POOL_SIZE = 8
+_BG_MAX_USES = 20
+_BG_FAILURE_BACKOFF_SECONDS = 60
+# Largest scene the route issues; sources are shrunk to just cover it, so a pooled
+# 1920x1080 wallpaper holds ~0.4 MB instead of ~8 MB.
+_BG_SOURCE_COVER = (440, 220)
 
 
-_TTL_SECONDS = 300
-_store: Dict[str, SlideChallenge] = {}
-_lock = threading.Lock()
+@dataclass
+class _PooledBackground:
+    image: Image.Image
+    uses: int = 0
 
 
-def _purge_locked(now: float) -> None:
-    dead = [k for k, v in _store.items() if v.expires_at <= now]
-    for k in dead:
-        del _store[k]
+_bg_pool: Deque[_PooledBackground] = deque(maxlen=_BG_POOL_SIZE)
+_bg_failed_at = 0.0
+_bg_lock = threading.Lock()
 
 
 def _render_slide_png(
@@ -43,8 +56,11 @@ def _render_slide_png(
     Target (target_x, target_y) is the top-left of the square that bounds the puzzle piece / hole.
     Coordinates are not exposed in JSON; clients infer the gap from alpha.
     """
-    base_img = _load_background_from_api(scene_w, scene_h)
-    if base_img is None:
+    source = _pooled_background()
+    if source is not None:
+        # fit() returns a new image; the pooled source is never modified.
+        base_img = ImageOps.fit(source, (scene_w, scene_h), method=Image.Resampling.LANCZOS)
+    else:
         gray = Image.effect_noise((scene_w, scene_h), 72)
         rch = gray.point(lambda p: min(255, int(p * 1.15 + 35)))
         gch = gray.point(lambda p: min(255, int(p * 0.95 + 28)))
@@ -72,15 +88,15 @@ def _render_slide_png(
     piece_img.putalpha(mask)
 
     hole_buf = io.BytesIO()
-    img.save(hole_buf, format="PNG", compress_level=9, optimize=True)
+    img.save(hole_buf, **_PNG_SAVE_OPTIONS)
     piece_buf = io.BytesIO()
-    piece_img.save(piece_buf, format="PNG", compress_level=9, optimize=True)
+    piece_img.save(piece_buf, **_PNG_SAVE_OPTIONS)
     return hole_buf.getvalue(), piece_buf.getvalue()
 
 
-def _load_background_from_api(scene_w: int, scene_h: int) -> Image.Image | None:
+def _load_background_from_api() -> Image.Image | None:
     """
-    Fetch background image from configured interface and resize/crop to scene size.
+    Fetch background image from configured interface, downscaled to cover _BG_SOURCE_COVER.
     Returns RGBA image or None when fetch/parse fails.
     """
     settings = get_settings()
@@ -99,11 +115,46 @@ def _load_background_from_api(scene_w: int, scene_h: int) -> Image.Image | None:
             data = resp.read()
         with Image.open(io.BytesIO(data)) as raw:
             base = raw.convert("RGBA")
-        return ImageOps.fit(base, (scene_w, scene_h), method=Image.Resampling.LANCZOS)
+        cover_w, cover_h = _BG_SOURCE_COVER
+        scale = max(cover_w / base.width, cover_h / base.height)
+        if scale < 1:
+            base = base.resize(
+                (max(cover_w, round(base.width * scale)), max(cover_h, round(base.height * scale))),
+                Image.Resampling.LANCZOS,
+            )
+        return base
     except Exception:
         return None
 
 
+def _pooled_background() -> Image.Image | None:
+    """
+    Source image for one challenge. Pooled images are shared read-only (the renderer
+    fits a new copy to the scene size). While the pool is short a new image is fetched;
+    after a failed fetch the noise fallback is used for a while rather than waiting on
+    the timeout again.
+    """
+    global _bg_failed_at
+    with _bg_lock:
+        backing_off = time.time() - _bg_failed_at < _BG_FAILURE_BACKOFF_SECONDS
+        if len(_bg_pool) >= _BG_POOL_SIZE or (_bg_pool and backing_off):
+            entry = secrets.choice(_bg_pool)
+            entry.uses += 1
+            if entry.uses >= _BG_MAX_USES:
+                _bg_pool.remove(entry)
+            return entry.image
+        if backing_off:
+            return None
+
+    image = _load_background_from_api()
+    with _bg_lock:
+        if image is None:
+            _bg_failed_at = time.time()
+        elif len(_bg_pool) < _BG_POOL_SIZE:
+            _bg_pool.append(_PooledBackground(image=image, uses=1))
+    return image
+
+
 def issue_slide_challenge(*, scene_width: int = 320, scene_height: int = 160) -> Tuple[str, bytes, bytes, int, int]:
     """
     Create challenge; returns captcha_id, PNG bytes, and scene dimensions.
@@ -118,25 +169,18 @@ def issue_slide_challenge(*, scene_width: int = 320, scene_height: int = 160) ->
     target_x = secrets.randbelow(max_x - min_x + 1) + min_x
     target_y = secrets.randbelow(max_y - min_y + 1) + min_y
     cid = secrets.token_urlsafe(24)
-    exp = time.time() + _TTL_SECONDS
 
     hole_png, piece_png = _render_slide_png(scene_width, scene_height, target_x, target_y, piece_size=piece_size)
 
-    with _lock:
-        _purge_locked(time.time())
-        _store[cid] = SlideChallenge(target_x=target_x, target_y=target_y, expires_at=exp)
+    # Only the x offset is checked on submit.
+    ephemeral_store.put(_NAMESPACE, cid, str(target_x), ttl_seconds=_TTL_SECONDS)
 
     return cid, hole_png, piece_png, scene_width, scene_height
 
 
 def validate_and_consume_slide(*, captcha_id: str, piece_final_x: int, tolerance: int = 14) -> bool:
     """Return True if piece_final_x matches. Challenge is always consumed (one attempt)."""
-    now = time.time()
-    with _lock:
-        _purge_locked(now)
-        ch = _store.pop(captcha_id, None)
-        if not ch or ch.expires_at <= now:
-            return False
-        if abs(int(piece_final_x) - ch.target_x) > tolerance:
-            return False
-        return True
+    stored = ephemeral_store.pop(_NAMESPACE, captcha_id)
+    if stored is None:
+        return False
+    return abs(int(piece_final_x) - int(stored)) <= tolerance